@@ -0,0 +1,44 @@
+import os
+import sys
+import time
+
+# Benchmark the per-key cost of the TyperEngine output backends.
+# Run against a throwaway X server so the keys go nowhere, e.g.:
+#   Xvfb :99 &
+#   DISPLAY=:99 python bench_backends.py 2000
+
+from typer_engine import create_keyboard
+
+TEXT = "The quick brown fox jumps over the lazy dog. "
+
+def bench(backend, count):
+    keyboard = create_keyboard(backend)
+    flush = getattr(keyboard, 'flush', None)
+    text = (TEXT * (count // len(TEXT) + 1))[:count]
+
+    start = time.perf_counter()
+    for char in text:
+        keyboard.type(char)
+        # Flush per key, which is what TyperEngine does when it is on schedule
+        if flush:
+            flush()
+    elapsed = time.perf_counter() - start
+
+    if hasattr(keyboard, 'close'):
+        keyboard.close()
+    return elapsed
+
+if __name__ == "__main__":
+    if not os.environ.get("DISPLAY"):
+        print("Bench: DISPLAY is not set. Start Xvfb and set DISPLAY first.")
+        sys.exit(1)
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    print(f"Bench: Typing {count} characters per backend on {os.environ['DISPLAY']}")
+    for backend in ("pynput", "xtest"):
+        try:
+            elapsed = bench(backend, count)
+        except Exception as e:
+            print(f"Bench: {backend} failed: {e}")
+            continue
+        print(f"Bench: {backend:7s} {elapsed:.3f}s total, {elapsed / count * 1000:.3f} ms/key")
@@ -0,0 +1,108 @@
+import argparse
+import math
+import multiprocessing
+import os
+import queue
+import sys
+import time
+
+from typer_engine import run_typer_process, BACKENDS
+from recorder import load_profile_file
+
+# Headless job runner: types each file in turn, unattended.
+#   python cli.py chapter1.txt chapter2.txt:5 --wpm 80 --gap 2 --profile ~/HumanTyperProfiles/Me.json
+# A ":<priority>" suffix makes a file run before lower-priority ones (default 0).
+
+def parse_job_arg(arg):
+    """Splits "file.txt:5" into ("file.txt", 5). Plain paths get priority 0."""
+    if not os.path.exists(arg) and ':' in arg:
+        path, suffix = arg.rsplit(':', 1)
+        if path and suffix.lstrip('-').isdigit():
+            return path, int(suffix)
+    return arg, 0
+
+def main():
+    parser = argparse.ArgumentParser(description="Type text files one after another into the focused window.")
+    parser.add_argument("files", nargs="+", help="Text files to type, in order; append :N to give a file priority N")
+    parser.add_argument("--wpm", type=int, default=60, help="Typing speed (default: 60)")
+    parser.add_argument("--profile", help="Path to a recorded profile JSON")
+    parser.add_argument("--gap", type=float, default=1.0, help="Seconds between documents (default: 1)")
+    parser.add_argument("--backend", choices=BACKENDS, default="pynput", help="Keyboard output backend (default: pynput)")
+    parser.add_argument("--delay", type=float, default=5.0, help="Seconds to focus the target window before typing starts (default: 5)")
+    args = parser.parse_args()
+    if args.wpm < 1:
+        parser.error("--wpm must be at least 1")
+    if not (math.isfinite(args.gap) and args.gap >= 0):
+        parser.error("--gap must be a finite number of seconds >= 0")
+
+    profile_ref = None
+    if args.profile:
+        path = os.path.abspath(os.path.expanduser(args.profile))
+        try:
+            _, content_hash = load_profile_file(path)
+        except Exception as e:
+            print(f"CLI: Failed to load profile: {e}")
+            return 1
+        profile_ref = (path, content_hash)
+
+    # Read everything up front so a bad path fails before the worker starts
+    jobs = []
+    for arg in args.files:
+        path, priority = parse_job_arg(arg)
+        try:
+            with open(path, 'r') as f:
+                text = f.read()
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"CLI: Cannot read {path}: {e}")
+            return 1
+        if not text:
+            print(f"CLI: Skipping empty file {path}.")
+            continue
+        job = {'text': text, 'name': os.path.basename(path), 'wpm': args.wpm, 'priority': priority}
+        if profile_ref:
+            job['profile'] = profile_ref
+        jobs.append(job)
+
+    if not jobs:
+        print("CLI: Nothing to type.")
+        return 1
+
+    command_queue = multiprocessing.Queue()
+    result_queue = multiprocessing.Queue()
+    worker = multiprocessing.Process(target=run_typer_process, args=(command_queue, result_queue, args.backend), daemon=True)
+    worker.start()
+
+    command_queue.put(("UPDATE_SPEED", args.wpm))
+    command_queue.put(("UPDATE_JOB_GAP", args.gap))
+    for job in jobs:
+        command_queue.put(("ADD_JOB", job))
+
+    print(f"CLI: Typing {len(jobs)} file(s) in {args.delay:.0f}s. Focus the target window now.")
+    time.sleep(args.delay)
+    command_queue.put(("START_JOBS", None))
+
+    try:
+        while True:
+            try:
+                msg, data = result_queue.get(timeout=1.0)
+            except queue.Empty:
+                if not worker.is_alive():
+                    print("CLI: Worker exited unexpectedly.")
+                    return 1
+                continue
+            if msg == "JOB_DONE":
+                print(f"CLI: {data['name']}: {data['chars']}/{data['total_chars']} chars in "
+                      f"{data['duration']:.1f}s ({data['wpm']:.0f} WPM)")
+            elif msg == "JOBS_DONE":
+                print(f"CLI: Finished {data} job(s).")
+                return 0
+    except KeyboardInterrupt:
+        print("CLI: Interrupted.")
+        return 1
+    finally:
+        command_queue.put(("KILL", None))
+        worker.join(timeout=2)
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -2,11 +2,12 @@
 import customtkinter as ctk
 import multiprocessing
 import json
+import math
 import os
 import sys
 import time
-from typer_engine import run_typer_process
-from recorder import run_recorder_process, merge_profiles
+from typer_engine import run_typer_process, estimate_duration
+from recorder import run_recorder_process, merge_profiles, load_profile_file
 
 ctk.set_appearance_mode("Dark")
 ctk.set_default_color_theme("blue")
@@ -20,7 +21,10 @@ class TyperAPP(ctk.CTk):
 
         # Multiprocessing Setup
         self.queue = multiprocessing.Queue()
-        self.worker_process = multiprocessing.Process(target=run_typer_process, args=(self.queue,), daemon=True)
+        self.worker_queue_result = multiprocessing.Queue()
+        # Output backend: "pynput" (default), "xtest" or "auto"; set TYPER_BACKEND to opt in to XTest
+        backend = os.environ.get("TYPER_BACKEND", "pynput")
+        self.worker_process = multiprocessing.Process(target=run_typer_process, args=(self.queue, self.worker_queue_result, backend), daemon=True)
         self.worker_process.start()
 
         # Recorder Process Setup
@@ -30,8 +34,11 @@ class TyperAPP(ctk.CTk):
         self.recorder_process.start()
 
         self.profile = None
+        self.profile_ref = None # (path, content_hash) of the selected profile, sent to the worker
         self.is_recording = False # GUI state
         self.is_enabled = False # Logical state
+        self.pending_jobs = 0 # Jobs queued in the worker but not finished
+        self.job_count = 0 # Used to name jobs
         
         self.profile_path = os.path.join(os.path.expanduser("~"), "typer_user_profile.json")
         
@@ -50,6 +57,9 @@ class TyperAPP(ctk.CTk):
         self.textbox = ctk.CTkTextbox(self, width=500, height=300)
         self.textbox.grid(row=1, column=0, padx=20, pady=10, sticky="nsew")
         self.textbox.insert("0.0", "Paste your text here...")
+        # <<Modified>> covers typing, mouse/menu paste and programmatic inserts
+        self.textbox.bind("<<Modified>>", self.on_text_modified)
+        self.textbox.edit_modified(False) # The placeholder insert already set the flag
 
         # Controls Frame
         self.frame_controls = ctk.CTkFrame(self)
@@ -64,6 +74,11 @@ class TyperAPP(ctk.CTk):
         self.slider_speed.set(60)
         self.slider_speed.grid(row=1, column=0, columnspan=2, padx=20, pady=(0, 20), sticky="ew")
 
+        # Estimated duration
+        self.label_eta = ctk.CTkLabel(self.frame_controls, text="Estimated time: -", text_color="gray")
+        self.label_eta.grid(row=3, column=0, columnspan=2, pady=(0, 10))
+        self.update_eta()
+
         # Buttons
         self.btn_listen = ctk.CTkButton(self.frame_controls, text="Enable Typing (Right Shift)", command=self.toggle_enable)
         self.btn_listen.grid(row=2, column=0, padx=10, pady=10)
@@ -75,6 +90,32 @@ class TyperAPP(ctk.CTk):
         self.label_spacer = ctk.CTkLabel(self.frame_controls, text="")
         self.label_spacer.grid(row=2, column=2, padx=5, pady=10)
 
+        # Job Queue
+        self.btn_queue = ctk.CTkButton(self.frame_controls, text="Add Text to Queue", command=self.add_job)
+        self.btn_queue.grid(row=4, column=0, padx=10, pady=(0, 10))
+
+        self.label_queue = ctk.CTkLabel(self.frame_controls, text="Queue: empty", text_color="gray")
+        self.label_queue.grid(row=4, column=1, padx=5, pady=(0, 10))
+
+        # Job options: higher priority runs first, gap is the pause between jobs
+        self.frame_queue = ctk.CTkFrame(self.frame_controls, fg_color="transparent")
+        self.frame_queue.grid(row=5, column=0, columnspan=2, pady=(0, 10))
+
+        self.label_priority = ctk.CTkLabel(self.frame_queue, text="Priority:")
+        self.label_priority.grid(row=0, column=0, padx=(0, 5))
+        self.entry_priority = ctk.CTkEntry(self.frame_queue, width=50)
+        self.entry_priority.insert(0, "0")
+        self.entry_priority.grid(row=0, column=1, padx=(0, 15))
+
+        self.label_gap = ctk.CTkLabel(self.frame_queue, text="Gap (s):")
+        self.label_gap.grid(row=0, column=2, padx=(0, 5))
+        self.entry_gap = ctk.CTkEntry(self.frame_queue, width=50)
+        self.entry_gap.insert(0, "1")
+        self.entry_gap.grid(row=0, column=3)
+
+        # Periodic check for job results
+        self.check_worker_queue()
+
         # Profile Management Frame
         self.frame_profiles = ctk.CTkFrame(self)
         self.frame_profiles.grid(row=3, column=0, padx=20, pady=(0, 20), sticky="ew")
@@ -151,26 +192,43 @@ class TyperAPP(ctk.CTk):
     def on_profile_select(self, choice):
         if choice == "Default (Generic)":
             self.profile = None
+            self.profile_ref = None
             self.slider_speed.configure(state="normal")
             self.label_status.configure(text="Status: Selected Default Profile.", text_color="gray")
             # Update worker to clear profile
-            self.queue.put(("UPDATE_PROFILE", None))
+            self.queue.put(("SELECT_PROFILE", None))
+            self.update_eta()
         else:
             path = os.path.join(self.profiles_dir, choice + ".json")
             try:
-                with open(path, 'r') as f:
-                    self.profile = json.load(f)
+                self.profile, content_hash = load_profile_file(path)
+                self.profile_ref = (path, content_hash)
                 self.label_status.configure(text=f"Status: Loaded '{choice}'.", text_color="#3B8ED0")
                 
                 # If match mode is ON, update speed immediately
                 if self.switch_match.get() == 1:
                     self.apply_profile_speed()
                     
-                # Send to worker
-                self.queue.put(("UPDATE_PROFILE", self.profile))
+                # Send only the reference; the worker loads and caches it
+                self.queue.put(("SELECT_PROFILE", self.profile_ref))
+                self.update_eta()
             except Exception as e:
                 print(f"Error loading profile: {e}")
 
+    def reload_profile(self, path, content_hash):
+        # The worker found the selected profile changed on disk; pick up the same contents it uses
+        if not self.profile_ref or self.profile_ref[0] != path or self.profile_ref[1] == content_hash:
+            return
+        try:
+            self.profile, content_hash = load_profile_file(path)
+        except Exception as e:
+            print(f"Error reloading profile: {e}")
+            return
+        self.profile_ref = (path, content_hash)
+        if self.switch_match.get() == 1:
+            self.apply_profile_speed()
+        self.update_eta()
+
     def toggle_match_mode(self):
         if self.switch_match.get() == 1:
             # Enable Match Mode
@@ -299,6 +357,76 @@ class TyperAPP(ctk.CTk):
         self.label_speed.configure(text=f"Speed (WPM): {wpm}")
         # Send update to worker
         self.queue.put(("UPDATE_SPEED", wpm))
+        self.update_eta()
+
+    def format_duration(self, seconds):
+        minutes, seconds = divmod(int(round(seconds)), 60)
+        return f"{minutes}m {seconds:02d}s" if minutes else f"{seconds}s"
+
+    def on_text_modified(self, event=None):
+        # Tk only fires <<Modified>> when the flag flips, so reset it after each change
+        if not self.textbox.edit_modified():
+            return
+        self.textbox.edit_modified(False)
+        self.update_eta()
+
+    def update_eta(self):
+        # Cheap analytic estimate, safe to run on every edit or slider move
+        text = self.textbox.get("0.0", "end-1c")
+        wpm = int(self.slider_speed.get())
+        try:
+            eta = estimate_duration(text, wpm, self.profile)
+        except Exception as e:
+            print(f"GUI: ETA error: {e}")
+            return
+        if eta['mean'] <= 0:
+            self.label_eta.configure(text="Estimated time: -")
+            return
+        self.label_eta.configure(text=f"Estimated time: {self.format_duration(eta['mean'])} "
+                                      f"({self.format_duration(eta['low'])} - {self.format_duration(eta['high'])})")
+
+    def add_job(self):
+        # Queue the current text with the current speed and profile; Right Shift runs the queue
+        text = self.textbox.get("0.0", "end-1c")
+        if not text:
+            return
+        try:
+            priority = int(self.entry_priority.get() or 0)
+            gap = float(self.entry_gap.get() or 0)
+        except ValueError:
+            gap = math.nan
+        if not math.isfinite(gap):
+            self.label_queue.configure(text="Queue: priority must be a whole number, gap in seconds")
+            return
+        self.queue.put(("UPDATE_JOB_GAP", max(0.0, gap)))
+
+        self.pending_jobs += 1
+        self.job_count += 1
+        self.queue.put(("ADD_JOB", {
+            'text': text,
+            'name': f"Job {self.job_count}",
+            'wpm': int(self.slider_speed.get()),
+            'profile': self.profile_ref,
+            'priority': priority,
+        }))
+        self.label_queue.configure(text=f"Queue: {self.pending_jobs} pending")
+
+    def check_worker_queue(self):
+        try:
+            while not self.worker_queue_result.empty():
+                msg, data = self.worker_queue_result.get_nowait()
+                if msg == "JOB_DONE":
+                    self.pending_jobs = max(0, self.pending_jobs - 1)
+                    self.label_queue.configure(text=f"{data['name']}: {data['chars']} chars in "
+                                                    f"{self.format_duration(data['duration'])} ({data['wpm']:.0f} WPM)")
+                elif msg == "JOBS_DONE":
+                    self.pending_jobs = 0
+                    self.play_sound("success")
+                elif msg == "PROFILE_CHANGED":
+                    self.reload_profile(*data)
+        except Exception as e:
+            print(f"GUI: Worker Queue Error: {e}")
+        self.after(100, self.check_worker_queue)
 
     def toggle_enable(self):
         if self.is_enabled:
@@ -317,8 +445,8 @@ class TyperAPP(ctk.CTk):
             # Send all current state to enable worker
             self.queue.put(("UPDATE_TEXT", text))
             self.queue.put(("UPDATE_SPEED", wpm))
-            if self.profile:
-                self.queue.put(("UPDATE_PROFILE", self.profile))
+            if self.profile_ref:
+                self.queue.put(("SELECT_PROFILE", self.profile_ref))
             self.queue.put(("ENABLE", None))
             
             self.btn_listen.configure(text="Disable Typing (Right Shift)", fg_color="green")
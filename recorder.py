@@ -1,6 +1,7 @@
 
 import time
 import json
+import hashlib
 import numpy as np
 import queue
 
@@ -96,6 +97,15 @@ def merge_profiles(old_profile, new_profile):
         'delay_samples': merged_delays
     }
 
+def load_profile_file(path):
+    """
+    Reads a profile JSON file.
+    Returns (profile, content_hash) so the profile can be referred to by path + hash.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    return json.loads(data), hashlib.sha1(data).hexdigest()
+
 def run_recorder_process(command_queue, result_queue):
     """
     Worker process for recording keystrokes.
@@ -142,17 +152,27 @@ def run_recorder_process(command_queue, result_queue):
         
         last_time = current_time
 
-    def on_release(key):
-        pass
+    # The listener only runs between START and STOP so the recorder is free while idle.
+    listener = None
 
-    # Start listener
-    try:
-        listener = keyboard.Listener(on_press=on_press, on_release=on_release)
-        listener.start()
-        print("RECORDER: Listener started.")
-    except Exception as e:
-        print(f"RECORDER: Failed to start listener: {e}")
-        return
+    def start_listener():
+        nonlocal listener
+        if listener is not None:
+            return
+        try:
+            listener = keyboard.Listener(on_press=on_press)
+            listener.start()
+            print("RECORDER: Listener started.")
+        except Exception as e:
+            listener = None
+            print(f"RECORDER: Failed to start listener: {e}")
+
+    def stop_listener():
+        nonlocal listener
+        if listener is not None:
+            listener.stop()
+            listener = None
+            print("RECORDER: Listener stopped.")
 
     while True:
         try:
@@ -161,7 +181,7 @@ def run_recorder_process(command_queue, result_queue):
             
             if cmd == "KILL":
                 print("RECORDER: Received KILL.")
-                listener.stop()
+                stop_listener()
                 return
             
             elif cmd == "START":
@@ -171,10 +191,12 @@ def run_recorder_process(command_queue, result_queue):
                 is_recording = True
                 backspace_count = 0
                 total_chars = 0
+                start_listener()
                 
             elif cmd == "STOP":
                 print("RECORDER: Stopping recording...")
                 is_recording = False
+                stop_listener()
                 profile = calculate_profile(delays, backspace_count, total_chars)
                 # Send result back to GUI
                 if profile:
@@ -0,0 +1,9 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pynput picks its backend at import time and fails on Linux without a display.
+# The logic tests never send keys, so let them import typer_engine against pynput's dummy backend.
+if sys.platform.startswith("linux") and not os.environ.get("DISPLAY"):
+    os.environ.setdefault("PYNPUT_BACKEND", "dummy")
@@ -0,0 +1,76 @@
+import random
+
+import numpy as np
+import pytest
+
+import typer_engine
+from typer_engine import TyperEngine, estimate_duration, _clipped_normal_moments
+
+TEXT = "The quick brown fox jumps over the lazy dog. Pack my box with five dozen jugs! " * 3
+
+class NullKeyboard:
+    def type(self, text):
+        pass
+
+    def press(self, key):
+        pass
+
+    def release(self, key):
+        pass
+
+@pytest.fixture
+def engine(monkeypatch):
+    monkeypatch.setattr(typer_engine, "create_keyboard", lambda backend="pynput": NullKeyboard())
+    return TyperEngine()
+
+def simulate(engine, text, wpm, profile, runs=400):
+    # Sum of the delays type_text would sleep, following the same typo logic
+    base_delay = typer_engine.calculate_base_delay(wpm)
+    mistake_chance = typer_engine.calculate_mistake_chance(wpm, profile)
+    totals = []
+    for _ in range(runs):
+        total = 0.0
+        for char in text:
+            if random.random() < mistake_chance and char.lower() in TyperEngine.QWERTY_MAP:
+                total += engine._calculate_delay(base_delay, profile) * 0.8
+                total += engine._calculate_delay(base_delay, profile) * 0.5
+            total += engine._calculate_delay(base_delay, profile)
+        totals.append(total)
+    return float(np.mean(totals)), float(np.std(totals))
+
+PROFILES = {
+    'generic': None,
+    'mean_delay': {'mean_delay': 0.2, 'std_dev': 0.15, 'mistake_rate': 0.05, 'wpm': 50},
+    'delay_samples': {'delay_samples': tuple(np.random.default_rng(1).lognormal(0, 0.5, 1000)),
+                      'mistake_rate': 0.03, 'wpm': 70},
+}
+
+@pytest.mark.parametrize("name", sorted(PROFILES))
+def test_estimate_matches_simulation(engine, name):
+    random.seed(0)
+    np.random.seed(0)
+    profile = PROFILES[name]
+    mean, std = simulate(engine, TEXT, 80, profile)
+    eta = estimate_duration(TEXT, 80, profile)
+    assert eta['mean'] == pytest.approx(mean, rel=0.03)
+    assert eta['std'] == pytest.approx(std, rel=0.15)
+    assert eta['low'] < eta['mean'] < eta['high']
+
+def test_estimate_empty_text():
+    assert estimate_duration("", 60) == {'mean': 0.0, 'std': 0.0, 'low': 0.0, 'high': 0.0}
+
+def test_wider_confidence_gives_wider_interval():
+    narrow = estimate_duration(TEXT, 60, confidence=0.5)
+    wide = estimate_duration(TEXT, 60, confidence=0.99)
+    assert wide['low'] < narrow['low'] and wide['high'] > narrow['high']
+
+@pytest.mark.parametrize("mean, std", [(0.2, 0.05), (0.02, 0.02), (0.005, 0.01)])
+def test_clipped_normal_moments(mean, std):
+    draws = np.maximum(typer_engine.MIN_DELAY, np.random.default_rng(0).normal(mean, std, 400_000))
+    first, var = _clipped_normal_moments(mean, std)
+    assert first == pytest.approx(draws.mean(), rel=0.01)
+    assert var == pytest.approx(draws.var(), rel=0.02)
+
+def test_clipped_normal_moments_without_spread():
+    assert _clipped_normal_moments(0.2, 0.0) == (0.2, 0.0)
+    assert _clipped_normal_moments(0.001, 0.0) == (typer_engine.MIN_DELAY, 0.0)
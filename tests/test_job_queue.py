@@ -0,0 +1,134 @@
+import math
+import queue
+import threading
+import time
+
+import pytest
+
+import typer_engine
+from typer_engine import validate_job
+
+class RecordingKeyboard:
+    """Stub backend that records what would have been typed."""
+    def __init__(self):
+        self.keys = []
+
+    def type(self, text):
+        self.keys.append(text)
+
+    def press(self, key):
+        self.keys.append(key)
+
+    def release(self, key):
+        pass
+
+    def text(self):
+        # Apply backspaces the way a text field would
+        out = []
+        for key in list(self.keys):
+            if isinstance(key, str):
+                out.append(key)
+            elif out:
+                out.pop()
+        return "".join(out)
+
+class NullListener:
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+@pytest.fixture
+def worker(monkeypatch):
+    keyboard = RecordingKeyboard()
+    monkeypatch.setattr(typer_engine, "create_keyboard", lambda backend="pynput": keyboard)
+    monkeypatch.setattr(typer_engine, "create_trigger_listener", lambda on_trigger: NullListener())
+
+    commands, results = queue.Queue(), queue.Queue()
+    thread = threading.Thread(target=typer_engine.run_typer_process, args=(commands, results), daemon=True)
+    thread.start()
+    commands.put(("UPDATE_JOB_GAP", 0))
+    yield commands, results, keyboard
+
+    commands.put(("KILL", None))
+    thread.join(timeout=5)
+
+def collect(results, timeout=30):
+    # Messages up to and including JOBS_DONE
+    messages = []
+    while True:
+        msg, data = results.get(timeout=timeout)
+        messages.append((msg, data))
+        if msg == "JOBS_DONE":
+            return messages
+
+@pytest.mark.parametrize("job, error", [
+    ({'text': 'hi'}, None),
+    ({'text': 'hi', 'wpm': 1, 'priority': -2, 'profile': None}, None),
+    ({'text': 'hi', 'profile': ('/tmp/p.json', 'abc')}, None),
+    ({'name': 'no text'}, "text"),
+    ({'text': ''}, "text"),
+    ("hi", "dict"),
+    ({'text': 'hi', 'priority': 'high'}, "priority"),
+    ({'text': 'hi', 'priority': True}, "priority"),
+    ({'text': 'hi', 'wpm': 0.5}, "wpm"),
+    ({'text': 'hi', 'wpm': math.inf}, "wpm"),
+    ({'text': 'hi', 'wpm': math.nan}, "wpm"),
+    ({'text': 'hi', 'profile': 'p.json'}, "profile"),
+])
+def test_validate_job(job, error):
+    result = validate_job(job)
+    if error is None:
+        assert result is None
+    else:
+        assert error in result
+
+def test_jobs_run_by_priority_then_fifo(worker):
+    commands, results, keyboard = worker
+    commands.put(("ADD_JOB", {'text': 'a', 'name': 'low-1', 'wpm': 3000}))
+    commands.put(("ADD_JOB", {'text': 'b', 'name': 'high', 'wpm': 3000, 'priority': 5}))
+    commands.put(("ADD_JOB", {'text': 'c', 'name': 'low-2', 'wpm': 3000}))
+    commands.put(("ADD_JOB", {'name': 'rejected'}))
+    commands.put(("START_JOBS", None))
+
+    messages = collect(results)
+    assert [data['name'] for msg, data in messages if msg == "JOB_DONE"] == ['high', 'low-1', 'low-2']
+    assert messages[-1] == ("JOBS_DONE", 3)
+    assert keyboard.text() == "bac"
+
+def test_paused_job_resumes_first_with_combined_stats(worker):
+    commands, results, keyboard = worker
+    text = "x" * 60
+    commands.put(("ADD_JOB", {'text': text, 'name': 'long', 'wpm': 600, 'priority': 1}))
+    commands.put(("ADD_JOB", {'text': 'next', 'name': 'next', 'wpm': 3000}))
+    commands.put(("ENABLE", None))
+    commands.put(("START_JOBS", None))
+
+    deadline = time.monotonic() + 10
+    while len(keyboard.text()) < 5 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    commands.put(("DISABLE", None))
+    time.sleep(0.3)
+    assert 0 < len(keyboard.text()) < len(text)
+    assert results.empty() # A paused job is not reported yet
+
+    commands.put(("ENABLE", None))
+    commands.put(("START_JOBS", None))
+    messages = collect(results)
+
+    done = [data for msg, data in messages if msg == "JOB_DONE"]
+    assert [data['name'] for data in done] == ['long', 'next']
+    assert done[0]['chars'] == done[0]['total_chars'] == len(text)
+    assert not done[0]['stopped']
+    assert messages[-1] == ("JOBS_DONE", 2)
+    assert keyboard.text() == text + "next"
+
+def test_bad_job_gap_keeps_worker_alive(worker):
+    commands, results, keyboard = worker
+    for gap in ("soon", None, math.inf, math.nan):
+        commands.put(("UPDATE_JOB_GAP", gap))
+    commands.put(("ADD_JOB", {'text': 'ok', 'name': 'ok', 'wpm': 3000}))
+    commands.put(("START_JOBS", None))
+    messages = collect(results, timeout=10)
+    assert messages[-1] == ("JOBS_DONE", 1)
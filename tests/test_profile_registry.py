@@ -0,0 +1,77 @@
+import json
+
+import pytest
+
+import typer_engine
+from recorder import load_profile_file
+from typer_engine import ProfileRegistry, prepare_profile
+
+@pytest.fixture
+def loads(monkeypatch):
+    # Records every file the registry actually reads
+    calls = []
+
+    def counting_load(path):
+        calls.append(path)
+        return load_profile_file(path)
+
+    monkeypatch.setattr(typer_engine, "load_profile_file", counting_load)
+    return calls
+
+def write_profile(path, wpm):
+    path.write_text(json.dumps({'wpm': wpm, 'mean_delay': 0.2, 'delay_samples': [1, 0.5, 2]}))
+    return str(path), load_profile_file(str(path))[1]
+
+def test_repeat_lookup_is_cached(tmp_path, loads):
+    path, content_hash = write_profile(tmp_path / "a.json", 50)
+    registry = ProfileRegistry()
+    first, actual = registry.get(path, content_hash)
+    second, _ = registry.get(path, content_hash)
+    assert actual == content_hash
+    assert first is second
+    assert loads == [path]
+
+def test_least_recently_used_is_evicted(tmp_path, loads):
+    refs = [write_profile(tmp_path / f"{name}.json", 50) for name in "abc"]
+    registry = ProfileRegistry(max_size=2)
+    registry.get(*refs[0])
+    registry.get(*refs[1])
+    registry.get(*refs[0]) # a is now the most recent
+    registry.get(*refs[2]) # evicts b
+    assert len(loads) == 3
+
+    registry.get(*refs[0])
+    assert len(loads) == 3
+    registry.get(*refs[1])
+    assert len(loads) == 4
+
+def test_changed_file_is_reloaded_under_new_hash(tmp_path, loads):
+    path, old_hash = write_profile(tmp_path / "a.json", 50)
+    registry = ProfileRegistry()
+    assert registry.get(path, old_hash)[0]['wpm'] == 50
+
+    _, new_hash = write_profile(tmp_path / "a.json", 70)
+    profile, actual = registry.get(path, new_hash)
+    assert actual == new_hash != old_hash
+    assert profile['wpm'] == 70
+    assert len(loads) == 2
+
+def test_stale_hash_is_reported_and_cached(tmp_path, loads):
+    path, old_hash = write_profile(tmp_path / "a.json", 50)
+    _, new_hash = write_profile(tmp_path / "a.json", 70)
+    registry = ProfileRegistry()
+
+    profile, actual = registry.get(path, old_hash)
+    assert actual == new_hash
+    assert profile['wpm'] == 70
+
+    # Neither the stale nor the current reference reads the file again
+    assert registry.get(path, old_hash)[0] is profile
+    assert registry.get(path, new_hash)[0] is profile
+    assert len(loads) == 1
+
+def test_prepare_profile_freezes_samples():
+    prepared = prepare_profile({'wpm': 50, 'delay_samples': [1, 0.5, 2]})
+    assert prepared['delay_samples'] == (1.0, 0.5, 2.0)
+    assert all(type(x) is float for x in prepared['delay_samples'])
+    assert prepare_profile(None) is None
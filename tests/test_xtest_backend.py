@@ -0,0 +1,131 @@
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+import pytest
+
+# Types through XTestKeyboard into a window on a private Xvfb server and checks what arrived.
+# Skipped when Xvfb or python-xlib is not installed.
+
+pytest.importorskip("Xlib")
+from Xlib import X, XK
+from Xlib.display import Display
+
+XVFB = shutil.which("Xvfb")
+pytestmark = pytest.mark.skipif(XVFB is None, reason="Xvfb is not installed")
+
+# Not on any Xvfb keymap, so XTestKeyboard has to hand it to pynput
+FALLBACK_CHAR = 'ŝ'
+
+@pytest.fixture(scope="module")
+def xvfb():
+    read_fd, write_fd = os.pipe()
+    proc = subprocess.Popen([XVFB, "-displayfd", str(write_fd), "-screen", "0", "640x480x24", "-nolisten", "tcp"],
+                            pass_fds=(write_fd,), stderr=subprocess.DEVNULL)
+    os.close(write_fd)
+    with os.fdopen(read_fd, 'rb') as f:
+        number = f.readline().strip()
+    if not number:
+        proc.kill()
+        pytest.skip("Xvfb failed to start")
+
+    name = f":{number.decode()}"
+    old_env = {key: os.environ.get(key) for key in ("DISPLAY", "PYNPUT_BACKEND")}
+    os.environ["DISPLAY"] = name # pynput picks its X connection up from here at import time
+    os.environ.pop("PYNPUT_BACKEND", None)
+    # Other tests may have imported pynput with the dummy backend (see conftest.py); re-import against Xvfb
+    for module in [m for m in sys.modules if m == "pynput" or m.startswith("pynput.") or m == "xtest_backend"]:
+        del sys.modules[module]
+    yield name
+
+    for key, value in old_env.items():
+        if value is None:
+            os.environ.pop(key, None)
+        else:
+            os.environ[key] = value
+    proc.terminate()
+    proc.wait(timeout=5)
+
+def keysym_to_char(keysym):
+    from pynput._util.xorg_keysyms import SYMBOLS
+    if keysym in (XK.XK_Return, XK.XK_KP_Enter):
+        return '\n'
+    if keysym & 0xff000000 == 0x01000000:
+        return chr(keysym & 0xffffff)
+    if keysym < 0x100:
+        return chr(keysym)
+    for code, char in SYMBOLS.values():
+        if code == keysym:
+            return char
+    return ''
+
+class Receiver:
+    """A focused window that turns the KeyPress events it gets back into text."""
+    def __init__(self, name):
+        self.display = Display(name)
+        screen = self.display.screen()
+        self.window = screen.root.create_window(0, 0, 200, 100, 0, screen.root_depth, event_mask=X.KeyPressMask)
+        self.window.map()
+        self.display.sync()
+        self.window.set_input_focus(X.RevertToParent, X.CurrentTime)
+        self.display.sync()
+
+    def read(self, expected, timeout=5.0):
+        text = []
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline and "".join(text) != expected:
+            while self.display.pending_events():
+                event = self.display.next_event()
+                if event.type == X.MappingNotify:
+                    # pynput borrows a keycode for characters not on the keymap
+                    self.display.refresh_keyboard_mapping(event)
+                    continue
+                if event.type != X.KeyPress:
+                    continue
+                index = 1 if event.state & X.ShiftMask else 0
+                keysym = self.display.keycode_to_keysym(event.detail, index)
+                if keysym == XK.XK_BackSpace:
+                    if text:
+                        text.pop()
+                elif keysym not in (XK.XK_Shift_L, XK.XK_Shift_R):
+                    text.append(keysym_to_char(keysym))
+            time.sleep(0.02)
+        return "".join(text)
+
+    def close(self):
+        self.display.close()
+
+@pytest.fixture
+def receiver(xvfb):
+    receiver = Receiver(xvfb)
+    yield receiver
+    receiver.close()
+
+def test_types_plain_and_shifted_characters(xvfb, receiver):
+    from xtest_backend import XTestKeyboard
+    keyboard = XTestKeyboard(xvfb)
+    keyboard.type("Hello, World! 123")
+    keyboard.close()
+    assert receiver.read("Hello, World! 123") == "Hello, World! 123"
+
+def test_backspace(xvfb, receiver):
+    from pynput.keyboard import Key
+    from xtest_backend import XTestKeyboard
+    keyboard = XTestKeyboard(xvfb)
+    keyboard.type("abx")
+    keyboard.press(Key.backspace)
+    keyboard.release(Key.backspace)
+    keyboard.type("c")
+    keyboard.close()
+    assert receiver.read("abc") == "abc"
+
+def test_fallback_keeps_key_order(xvfb, receiver):
+    from xtest_backend import XTestKeyboard
+    keyboard = XTestKeyboard(xvfb)
+    assert keyboard._lookup(FALLBACK_CHAR) is None # Really goes through pynput
+    expected = "aB" + FALLBACK_CHAR + "cD"
+    keyboard.type(expected)
+    keyboard.close()
+    assert receiver.read(expected) == expected
@@ -1,9 +1,14 @@
 
+import sys
+import math
 import time
 import random
 import threading
 import multiprocessing
 import queue
+import heapq
+from collections import OrderedDict
+from statistics import NormalDist
 import numpy as np
 
 # Pynput must be imported safely. 
@@ -11,37 +16,223 @@ import numpy as np
 # but the listener must strictly belong to the child process.
 from pynput.keyboard import Controller, Key, Listener
 
+from recorder import load_profile_file
+
+TRIGGER_KEY = Key.shift_r
+VK_RSHIFT = 0xA1 # Windows virtual-key code for Right Shift
+MIN_DELAY = 0.01 # Shortest delay TyperEngine will sleep between keys
+
+def create_trigger_listener(on_trigger):
+    """
+    Builds a keyboard listener that only reacts to the trigger key (Right Shift).
+    On Windows, other keys are dropped by the low-level event filter before pynput decodes them.
+    The caller owns start()/stop(); a stopped listener cannot be restarted, so build a new one each time.
+    """
+    def on_release(key):
+        if key == TRIGGER_KEY:
+            on_trigger()
+
+    kwargs = {}
+    if sys.platform == "win32":
+        kwargs['win32_event_filter'] = lambda msg, data: data.vkCode == VK_RSHIFT
+    return Listener(on_release=on_release, **kwargs)
+
+def prepare_profile(profile):
+    """
+    Copies a profile for TyperEngine, once per profile.
+    delay_samples becomes a tuple of floats: cheap to index per key, and safe to share between cached jobs.
+    """
+    if not profile:
+        return None
+    prepared = dict(profile)
+    if prepared.get('delay_samples'):
+        prepared['delay_samples'] = tuple(float(x) for x in prepared['delay_samples'])
+    return prepared
+
+class ProfileRegistry:
+    """
+    Worker-side cache of prepared profiles, keyed by (path, content_hash).
+    The GUI only sends the reference; switching back to a recent profile is a dict lookup.
+    """
+    def __init__(self, max_size=8):
+        self.max_size = max_size
+        self.profiles = OrderedDict() # (path, hash) -> (prepared, actual_hash)
+
+    def get(self, path, content_hash):
+        """
+        Returns (prepared_profile, actual_hash).
+        If the file changed since the caller hashed it, actual_hash differs from content_hash;
+        the result is cached under both so a caller still holding the old hash does not re-read the file.
+        """
+        key = (path, content_hash)
+        if key in self.profiles:
+            self.profiles.move_to_end(key)
+            return self.profiles[key]
+
+        profile, actual_hash = load_profile_file(path)
+        entry = (prepare_profile(profile), actual_hash)
+        if actual_hash != content_hash:
+            print(f"WORKER: Profile {path} changed on disk, using current contents.")
+            self._store((path, actual_hash), entry)
+        self._store(key, entry)
+        return entry
+
+    def _store(self, key, entry):
+        self.profiles[key] = entry
+        self.profiles.move_to_end(key)
+        while len(self.profiles) > self.max_size:
+            self.profiles.popitem(last=False)
+
+class RateController:
+    """
+    Closed-loop pacing for TyperEngine.
+    Compares the time actually spent typing against the time the schedule asked for
+    and nudges a gain that scales every computed delay, so the achieved speed stays
+    within `tolerance` of the target no matter how slow the backend is.
+    """
+    def __init__(self, tolerance=0.05, smoothing=0.3, min_gain=0.2, max_gain=2.0):
+        self.tolerance = tolerance
+        self.smoothing = smoothing
+        self.min_gain = min_gain
+        self.max_gain = max_gain
+        self.reset()
+
+    def reset(self):
+        self.gain = 1.0
+        self.scheduled = 0.0 # Seconds the schedule asked for so far
+        self.start_time = None
+
+    def start(self):
+        self.reset()
+        self.start_time = time.perf_counter()
+
+    def add(self, delay):
+        """Records a delay the schedule intended (before gain/compensation)."""
+        self.scheduled += delay
+
+    def update(self):
+        if self.start_time is None or self.scheduled <= 0:
+            return self.gain
+        elapsed = time.perf_counter() - self.start_time
+        if elapsed <= 0:
+            return self.gain
+        # ratio > 1 means we are running slower than the target
+        ratio = elapsed / self.scheduled
+        if abs(ratio - 1.0) > self.tolerance:
+            target_gain = self.gain / ratio
+            self.gain += (target_gain - self.gain) * self.smoothing
+            self.gain = min(self.max_gain, max(self.min_gain, self.gain))
+        return self.gain
+
+def calculate_base_delay(wpm):
+    # Seconds per character at the target WPM (5 chars per word)
+    return 60.0 / (wpm * 5) if wpm > 0 else 0.1
+
+def calculate_mistake_chance(wpm, profile):
+    mistake_chance = max(0.01, (wpm / 150.0) * 0.10) # Default logic
+    if profile and 'mistake_rate' in profile:
+         # Scale user mistake rate by Speed multiplier?
+         # For now, let's use the recorded rate directly but allow it to scale if they type faster than their recording.
+         # Actually, simpler: Use recorded rate if speed matches, else scale.
+         # Let's just use the recorded rate as a baseline.
+         mistake_chance = profile['mistake_rate']
+         # If WPM is much higher than profile WPM, increase chance slightly?
+         if profile.get('wpm', 0) > 0 and wpm > profile['wpm']:
+             ratio = wpm / profile['wpm']
+             mistake_chance *= ratio
+    return mistake_chance
+
+BACKENDS = ("pynput", "xtest", "auto")
+
+def create_keyboard(backend="pynput"):
+    """
+    Returns the object TyperEngine sends keys through.
+    - "pynput": pynput Controller (every event is sent on its own)
+    - "xtest": batched X11 XTest backend, see xtest_backend.py
+    - "auto": XTest on Linux when an X server is reachable, pynput otherwise
+    pynput is the default; XTest is opt-in until it has seen more real-world use.
+    """
+    if backend == "pynput":
+        return Controller()
+    if backend == "xtest" or (backend == "auto" and sys.platform.startswith("linux")):
+        try:
+            from xtest_backend import XTestKeyboard
+            return XTestKeyboard()
+        except Exception as e:
+            if backend == "xtest":
+                raise
+            print(f"XTest backend unavailable, using pynput: {e}")
+    return Controller()
+
 class TyperEngine:
-    def __init__(self):
-        self.keyboard = Controller()
+    # Pacing settings
+    KEY_COST_SMOOTHING = 0.1 # EMA weight of each new measurement
+    KEY_COST_MAX = 0.05 # Samples above this are stalls, not injection cost, and are clamped
+    UPDATE_INTERVAL = 10 # Re-run the controller every N characters
+
+    def __init__(self, rate_tolerance=0.05, backend="pynput"):
+        self.keyboard = create_keyboard(backend)
         self.stop_event = threading.Event()
+        # Running estimate of backend seconds per scheduled key.
+        # Learned from the first real keys of type_text; no keys are sent just to measure it.
+        self.key_cost = 0.0
+        self.rate_controller = RateController(tolerance=rate_tolerance)
+
+        # Batching backends queue events until flushed; pynput sends them immediately
+        self.flush_keyboard = getattr(self.keyboard, 'flush', None)
+
+    def stop_typing(self):
+        self.stop_event.set()
+
+    def _emit(self, key):
+        # Send a character (or a special Key) and fold its cost into the running estimate
+        start = time.perf_counter()
+        if isinstance(key, Key):
+            self.keyboard.press(key)
+            self.keyboard.release(key)
+        else:
+            self.keyboard.type(key)
+        cost = min(time.perf_counter() - start, self.KEY_COST_MAX)
+        self.key_cost += (cost - self.key_cost) * self.KEY_COST_SMOOTHING
+
+    def _flush(self):
+        # Send events a batching backend has queued; returns the seconds it took
+        if not self.flush_keyboard:
+            return 0.0
+        start = time.perf_counter()
+        self.flush_keyboard()
+        return time.perf_counter() - start
+
+    def _sleep(self, delay):
+        # Sleep for the scheduled delay minus what the backend already took.
+        # When behind schedule there is nothing to wait for, so queued events ride with the next batch.
+        self.rate_controller.add(delay)
+        remaining = delay * self.rate_controller.gain - self.key_cost
+        if remaining > 0:
+            remaining -= self._flush()
+            if remaining > 0:
+                time.sleep(remaining)
 
     def type_text(self, text, wpm=60, profile=None):
+        """Types text and returns the number of characters typed (fewer if stopped)."""
         if not text:
-            return
+            return 0
         
         self.stop_event.clear() # Ensure event is clear at start of typing
         
-        # Calculate base delay
-        base_delay = 60.0 / (wpm * 5) if wpm > 0 else 0.1
-        
-        # Mistake Chance
-        mistake_chance = max(0.01, (wpm / 150.0) * 0.10) # Default logic
-        if profile and 'mistake_rate' in profile:
-             # Scale user mistake rate by Speed multiplier?
-             # For now, let's use the recorded rate directly but allow it to scale if they type faster than their recording.
-             # Actually, simpler: Use recorded rate if speed matches, else scale.
-             # Let's just use the recorded rate as a baseline.
-             mistake_chance = profile['mistake_rate']
-             # If WPM is much higher than profile WPM, increase chance slightly?
-             if profile.get('wpm', 0) > 0 and wpm > profile['wpm']:
-                 ratio = wpm / profile['wpm']
-                 mistake_chance *= ratio
+        base_delay = calculate_base_delay(wpm)
+        mistake_chance = calculate_mistake_chance(wpm, profile)
+
+        self.rate_controller.start()
+        typed = 0
 
         try:
-            for char in text:
+            for i, char in enumerate(text):
                 if self.stop_event.is_set():
                     break
+
+                if i and i % self.UPDATE_INTERVAL == 0:
+                    self.rate_controller.update()
                 
                 # Check for mistake
                 if random.random() < mistake_chance and char.lower() in self.QWERTY_MAP:
@@ -50,28 +241,32 @@ class TyperEngine:
                         typo_char = typo_char.upper()
                     
                     # Type wrong key
-                    self.keyboard.type(typo_char)
-                    time.sleep(self._calculate_delay(base_delay, profile) * 0.8) 
+                    self._emit(typo_char)
+                    self._sleep(self._calculate_delay(base_delay, profile) * 0.8)
                     
                     # Backspace
-                    self.keyboard.press(Key.backspace)
-                    self.keyboard.release(Key.backspace)
-                    time.sleep(self._calculate_delay(base_delay, profile) * 0.5)
+                    self._emit(Key.backspace)
+                    self._sleep(self._calculate_delay(base_delay, profile) * 0.5)
                 
                 # Determine delay for correct char
                 delay = self._calculate_delay(base_delay, profile)
                 
                 # Type the character
-                self.keyboard.type(char)
+                self._emit(char)
+                
+                typed += 1
                 
-                # Sleep
-                time.sleep(delay)
+                # Sleep (compensated for backend cost and drift)
+                self._sleep(delay)
                 
                 if self.stop_event.is_set(): # Check again after sleep
                     break
 
         except Exception as e:
             print(f"Error during typing: {e}")
+        finally:
+            self._flush()
+        return typed
 
     QWERTY_MAP = {
         'q': ['w', 'a', '1'], 'w': ['q', 'e', 's', '2'], 'e': ['w', 'r', 'd', '3'], 'r': ['e', 't', 'f', '4'], 't': ['r', 'y', 'g', '5'], 'y': ['t', 'u', 'h', '6'], 'u': ['y', 'i', 'j', '7'], 'i': ['u', 'o', 'k', '8'], 'o': ['i', 'p', 'l', '9'], 'p': ['o', 'l', '0'],
@@ -85,7 +280,7 @@ class TyperEngine:
             # Pick a random normalized sample
             factor = random.choice(profile['delay_samples'])
             # Apply to base_delay (which is based on current Target WPM)
-            return max(0.01, base_delay * factor)
+            return max(MIN_DELAY, base_delay * factor)
             
         elif profile and 'mean_delay' in profile:
             mean = profile.get('mean_delay', base_delay)
@@ -94,9 +289,110 @@ class TyperEngine:
         else:
             std = base_delay * 0.25
             delay = np.random.normal(base_delay, std)
-        return max(0.01, delay)
+        return max(MIN_DELAY, delay)
+
+def _clipped_normal_moments(mean, std, floor=MIN_DELAY):
+    # Mean and variance of max(floor, N(mean, std))
+    if std <= 0:
+        value = max(floor, mean)
+        return value, 0.0
+    nd = NormalDist()
+    alpha = (floor - mean) / std
+    cdf = nd.cdf(alpha)
+    pdf = nd.pdf(alpha)
+    first = floor * cdf + mean * (1 - cdf) + std * pdf
+    second = floor ** 2 * cdf + (mean ** 2 + std ** 2) * (1 - cdf) + std * (mean + floor) * pdf
+    return first, max(0.0, second - first ** 2)
+
+def _delay_moments(base_delay, profile):
+    # Mean and variance of one TyperEngine._calculate_delay() draw
+    if profile and 'delay_samples' in profile and profile['delay_samples']:
+        delays = np.maximum(MIN_DELAY, base_delay * np.asarray(profile['delay_samples'], dtype=float))
+        return float(delays.mean()), float(delays.var())
+    elif profile and 'mean_delay' in profile:
+        mean = profile.get('mean_delay', base_delay)
+        std = profile.get('std_dev', base_delay * 0.2)
+        return _clipped_normal_moments(mean, std)
+    return _clipped_normal_moments(base_delay, base_delay * 0.25)
+
+def estimate_duration(text, wpm=60, profile=None, confidence=0.95):
+    """
+    Analytic estimate of how long TyperEngine.type_text would take, without emitting keys.
+    Uses the same base delay, mistake chance and delay distribution as the engine and a
+    normal approximation for the interval. Cost is O(len(text)) in C plus O(len(delay_samples)).
+    Returns a dict with 'mean', 'std', 'low' and 'high' in seconds.
+    """
+    if not text:
+        return {'mean': 0.0, 'std': 0.0, 'low': 0.0, 'high': 0.0}
+
+    base_delay = calculate_base_delay(wpm)
+    p = min(1.0, calculate_mistake_chance(wpm, profile))
+    m, v = _delay_moments(base_delay, profile)
+
+    # Only characters in the QWERTY map can produce a typo
+    lowered = text.lower()
+    n = len(text)
+    n_typo = sum(lowered.count(c) for c in TyperEngine.QWERTY_MAP)
+
+    # A typo adds 0.8 * d1 + 0.5 * d2 (wrong key, then backspace)
+    typo_mean = 1.3 * m
+    typo_var = 0.89 * v
+    typo_second = typo_var + typo_mean ** 2
+
+    mean = n * m + n_typo * p * typo_mean
+    var = n * v + n_typo * (p * typo_second - (p * typo_mean) ** 2)
+    std = float(np.sqrt(max(0.0, var)))
+
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    return {
+        'mean': float(mean),
+        'std': std,
+        'low': float(max(0.0, mean - z * std)),
+        'high': float(mean + z * std),
+    }
+
+def validate_job(job):
+    """Returns why a job dict cannot be queued, or None if it is fine."""
+    if not isinstance(job, dict):
+        return "job must be a dict"
+    if not isinstance(job.get('text'), str) or not job['text']:
+        return "job needs non-empty 'text'"
+    priority = job.get('priority', 0)
+    if not isinstance(priority, (int, float)) or isinstance(priority, bool):
+        return "'priority' must be a number"
+    wpm = job.get('wpm')
+    if wpm is not None and (not isinstance(wpm, (int, float)) or isinstance(wpm, bool) or not 1 <= wpm < math.inf):
+        return "'wpm' must be a number >= 1"
+    profile = job.get('profile')
+    if profile is not None and not (isinstance(profile, (tuple, list)) and len(profile) == 2):
+        return "'profile' must be (path, content_hash) or None"
+    return None
+
+def run_job(engine, job, wpm, profile):
+    """
+    Types one queued job in the worker's typing thread and returns its timing stats.
+    A job resumed after a pause carries 'done_chars', 'done_time' and 'total_chars' from
+    its earlier runs, so the stats always cover the whole job.
+    """
+    text = job['text']
+    start = time.perf_counter()
+    typed = engine.type_text(text, wpm, profile)
+    duration = time.perf_counter() - start
+
+    chars = job.get('done_chars', 0) + typed
+    total_chars = job.get('total_chars', len(text))
+    duration += job.get('done_time', 0.0)
+    return {
+        'name': job.get('name', ''),
+        'chars': chars,
+        'total_chars': total_chars,
+        'duration': duration,
+        'target_wpm': wpm,
+        'wpm': (chars / 5.0) / (duration / 60.0) if duration > 0 else 0.0,
+        'stopped': chars < total_chars,
+    }
 
-def run_typer_process(command_queue):
+def run_typer_process(command_queue, result_queue=None, backend="pynput"):
     """
     Worker process that handles keyboard listening and typing.
     Communicates via command_queue:
@@ -105,43 +401,81 @@ def run_typer_process(command_queue):
     - ("UPDATE_TEXT", text_string)
     - ("UPDATE_SPEED", wpm_int)
     - ("UPDATE_PROFILE", profile_dict)
+    - ("SELECT_PROFILE", (path, content_hash) or None)
+    - ("ADD_JOB", job_dict) -> {'text', optional 'name', 'wpm', 'profile' (path, content_hash) or None, 'priority'}
+    - ("CLEAR_JOBS", None)
+    - ("UPDATE_JOB_GAP", seconds)
+    - ("START_JOBS", None) -> run queued jobs without waiting for the trigger key
     - ("KILL", None)
+    If a profile file changed after the sender hashed it, ("PROFILE_CHANGED", (path, actual_hash)) is sent on result_queue.
+    Queued jobs run one after another (highest priority first, FIFO within a priority) when triggered;
+    with no jobs queued the trigger types current_text as before.
+    backend selects the output backend, see create_keyboard().
+    Job stats are sent on result_queue as ("JOB_DONE", stats), then ("JOBS_DONE", count) when the queue drains.
     """
     print("WORKER: Starting Typer Worker Process...")
     
-    engine = TyperEngine()
+    try:
+        engine = TyperEngine(backend=backend)
+    except Exception as e:
+        print(f"WORKER: Backend '{backend}' unavailable, using pynput: {e}")
+        engine = TyperEngine()
     
     # State
-    enabled = False
     current_text = ""
     current_wpm = 60
     current_profile = None
+    profiles = ProfileRegistry()
+
+    def load_profile(ref):
+        # Resolve a (path, content_hash) reference and tell the sender if its copy is stale
+        path, content_hash = ref
+        profile, actual_hash = profiles.get(path, content_hash)
+        if actual_hash != content_hash and result_queue is not None:
+            result_queue.put(("PROFILE_CHANGED", (path, actual_hash)))
+        return profile
+
+    # Job queue: heap of (-priority, seq, job)
+    jobs = []
+    job_seq = 0
+    job_gap = 1.0 # Seconds between jobs
+    running_jobs = False
+    jobs_done = 0
+    next_job_at = 0.0 # perf_counter time the next job may start; None while one is running
+    active_job = None # Heap entry of the job being typed
+    job_results = [] # Stats appended by run_job in the typing thread (one per run)
+
+    def collect_job(*args):
+        job_results.append(run_job(*args))
     
-    # We need a way to check the queue AND listen for keys.
-    # Pynput listener is blocking if we use .join(), but non-blocking if we just .start().
-    # We will use a non-blocking listener strategy or a check loop.
-    
+    # The listener only exists while enabled, so an idle worker adds no cost to system-wide keystrokes.
+    # The callback just sets a flag; the main loop handles the typing.
     trigger_key_pressed = False
-    
-    def on_release(key):
+    listener = None
+
+    def on_trigger():
         nonlocal trigger_key_pressed
-        # We only care if enabled
-        if not enabled:
-            return
+        trigger_key_pressed = True
 
-        if key == Key.shift_r:
-            # We set a flag, and the main loop handles the typing.
-            # This avoids running heavy typing logic inside the callback thread.
-            trigger_key_pressed = True
+    def start_listener():
+        nonlocal listener
+        if listener is not None:
+            return
+        try:
+            listener = create_trigger_listener(on_trigger)
+            listener.start()
+            print("WORKER: Listener started.")
+        except Exception as e:
+            listener = None
+            print(f"WORKER: Failed to start listener: {e}")
 
-    # Start the listener in this process
-    try:
-        listener = Listener(on_release=on_release)
-        listener.start()
-        print("WORKER: Listener started.")
-    except Exception as e:
-        print(f"WORKER: Failed to start listener: {e}")
-        return
+    def stop_listener():
+        nonlocal listener
+        if listener is None:
+            return
+        listener.stop()
+        listener = None
+        print("WORKER: Listener stopped.")
 
     typing_thread = None
 
@@ -154,13 +488,15 @@ def run_typer_process(command_queue):
                     print("WORKER: Received KILL. Exiting.")
                     if typing_thread and typing_thread.is_alive():
                         engine.stop_typing()
-                    listener.stop()
+                    stop_listener()
                     return
                 elif cmd == "ENABLE":
-                    enabled = True
+                    start_listener()
                     print("WORKER: Enabled.")
                 elif cmd == "DISABLE":
-                    enabled = False
+                    stop_listener()
+                    trigger_key_pressed = False
+                    running_jobs = False # Pause the queue; remaining jobs stay queued
                     engine.stop_typing() # Stop current typing if any
                     print("WORKER: Disabled.")
                 elif cmd == "UPDATE_TEXT":
@@ -169,11 +505,64 @@ def run_typer_process(command_queue):
                 elif cmd == "UPDATE_SPEED":
                     current_wpm = int(data)
                 elif cmd == "UPDATE_PROFILE":
-                    current_profile = data
+                    current_profile = prepare_profile(data)
                     print("WORKER: Profile updated.")
+                elif cmd == "SELECT_PROFILE":
+                    if data is None:
+                        current_profile = None
+                    else:
+                        try:
+                            current_profile = load_profile(data)
+                        except Exception as e:
+                            print(f"WORKER: Failed to load profile {data[0]}: {e}")
+                            continue
+                    print("WORKER: Profile selected.")
+                elif cmd == "ADD_JOB":
+                    error = validate_job(data)
+                    if error:
+                        print(f"WORKER: Rejected job: {error}.")
+                        continue
+                    heapq.heappush(jobs, (-data.get('priority', 0), job_seq, data))
+                    job_seq += 1
+                    print(f"WORKER: Job queued (len={len(data['text'])}, pending={len(jobs)}).")
+                elif cmd == "CLEAR_JOBS":
+                    jobs = []
+                    print("WORKER: Job queue cleared.")
+                elif cmd == "UPDATE_JOB_GAP":
+                    try:
+                        gap = float(data)
+                    except (TypeError, ValueError):
+                        gap = math.nan
+                    if math.isfinite(gap):
+                        job_gap = max(0.0, gap)
+                    else:
+                        print(f"WORKER: Rejected job gap {data!r}.")
+                elif cmd == "START_JOBS":
+                    trigger_key_pressed = True
         except queue.Empty:
             pass
 
+        typing = typing_thread is not None and typing_thread.is_alive()
+
+        # A job stopped by DISABLE goes back on the heap with its untyped remainder,
+        # keeping its priority and sequence number so it runs first when the queue resumes.
+        # Its progress so far rides along so the final JOB_DONE covers the whole job.
+        if active_job is not None and not typing:
+            neg_priority, seq, job = active_job
+            active_job = None
+            stats = job_results.pop() if job_results else None
+            if stats and stats['stopped'] and engine.stop_event.is_set():
+                typed_now = stats['chars'] - job.get('done_chars', 0)
+                remainder = dict(job, text=job['text'][typed_now:], done_chars=stats['chars'],
+                                 done_time=stats['duration'], total_chars=stats['total_chars'])
+                heapq.heappush(jobs, (neg_priority, seq, remainder))
+                print(f"WORKER: Job '{stats['name']}' paused, {len(remainder['text'])} chars left.")
+            elif stats:
+                jobs_done += 1
+                print(f"WORKER: Job '{stats['name']}' done: {stats['chars']} chars in {stats['duration']:.1f}s ({stats['wpm']:.0f} WPM).")
+                if result_queue is not None:
+                    result_queue.put(("JOB_DONE", stats))
+
         # 2. Check if triggered
         if trigger_key_pressed:
             print("WORKER: Triggered! Typing...")
@@ -181,13 +570,43 @@ def run_typer_process(command_queue):
             trigger_key_pressed = False
             
             # Check if already typing
-            if typing_thread and typing_thread.is_alive():
+            if typing or running_jobs:
                 print("WORKER: Already typing, ignoring new trigger.")
+            elif jobs:
+                # jobs_done keeps counting across a pause; it resets once the queue drains
+                running_jobs = True
+                next_job_at = 0.0
             else:
                 # Start new typing thread
                 # engine.stop_event.clear() -> handled in type_text now
                 typing_thread = threading.Thread(target=engine.type_text, args=(current_text, current_wpm, current_profile))
                 typing_thread.start()
+                typing = True
+
+        # 3. Run queued jobs back to back, job_gap apart
+        if running_jobs and not typing:
+            if not jobs:
+                running_jobs = False
+                print(f"WORKER: Job queue finished ({jobs_done} jobs).")
+                if result_queue is not None:
+                    result_queue.put(("JOBS_DONE", jobs_done))
+                jobs_done = 0
+            elif next_job_at is None:
+                # Previous job just finished
+                next_job_at = time.perf_counter() + job_gap
+            elif time.perf_counter() >= next_job_at:
+                active_job = heapq.heappop(jobs)
+                job = active_job[2]
+                wpm = job.get('wpm') or current_wpm
+                profile = current_profile
+                if 'profile' in job:
+                    try:
+                        profile = load_profile(job['profile']) if job['profile'] else None
+                    except Exception as e:
+                        print(f"WORKER: Failed to load job profile, using current: {e}")
+                typing_thread = threading.Thread(target=collect_job, args=(engine, job, wpm, profile))
+                typing_thread.start()
+                next_job_at = None
 
         # Sleep a tiny bit to prevent CPU hogs
         time.sleep(0.05)
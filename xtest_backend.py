@@ -0,0 +1,117 @@
+
+# X11 output backend for TyperEngine.
+# pynput's Controller sends and flushes every event on its own; this one queues XTest
+# fake key events and only flushes when TyperEngine reaches a point in its schedule.
+# Needs python-xlib (installed with pynput on Linux) and a running X server.
+
+from Xlib import X, XK
+from Xlib.display import Display
+from Xlib.ext import xtest
+from pynput.keyboard import Controller, Key
+
+# Keysyms for the pynput special keys TyperEngine uses
+SPECIAL_KEYSYMS = {
+    Key.backspace: XK.XK_BackSpace,
+    Key.enter: XK.XK_Return,
+    Key.tab: XK.XK_Tab,
+    Key.shift: XK.XK_Shift_L,
+    Key.shift_l: XK.XK_Shift_L,
+    Key.shift_r: XK.XK_Shift_R,
+}
+
+CHAR_KEYSYMS = {
+    '\n': XK.XK_Return,
+    '\r': XK.XK_Return,
+    '\t': XK.XK_Tab,
+}
+
+def char_to_keysym(char):
+    if char in CHAR_KEYSYMS:
+        return CHAR_KEYSYMS[char]
+    code = ord(char)
+    # Latin-1 characters map directly, everything else uses the Unicode keysym range
+    if 0x20 <= code <= 0x7e or 0xa0 <= code <= 0xff:
+        return code
+    return 0x01000000 | code
+
+class XTestKeyboard:
+    """
+    Drop-in replacement for pynput's Controller (type/press/release) that batches events.
+    Call flush() to send the queued events; TyperEngine does this before each sleep.
+    Characters that need more than Shift (e.g. AltGr layers) or have no keycode are
+    sent through pynput instead, after flushing so ordering is kept.
+    """
+    def __init__(self, display=None, max_batch=64):
+        self.display = Display(display)
+        if not self.display.has_extension('XTEST'):
+            raise RuntimeError("X server does not support the XTEST extension")
+        self.max_batch = max_batch
+        self.pending = 0
+        self.shift_keycode = self.display.keysym_to_keycode(XK.XK_Shift_L)
+        self.keycode_cache = {} # char/Key -> (keycode, needs_shift) or None
+        self.fallback = None
+
+    def _lookup(self, key):
+        if key in self.keycode_cache:
+            return self.keycode_cache[key]
+
+        keysym = SPECIAL_KEYSYMS.get(key) if isinstance(key, Key) else char_to_keysym(key)
+        entry = None
+        if keysym:
+            for keycode, index in self.display.keysym_to_keycodes(keysym):
+                if index in (0, 1):
+                    entry = (keycode, index == 1)
+                    break
+        self.keycode_cache[key] = entry
+        return entry
+
+    def _fake(self, event_type, keycode):
+        xtest.fake_input(self.display, event_type, keycode)
+        self.pending += 1
+        if self.pending >= self.max_batch:
+            self.flush()
+
+    def _fallback(self):
+        if self.fallback is None:
+            self.fallback = Controller()
+        # pynput uses its own X connection; wait until the server has handled our queued events
+        self.flush()
+        self.display.sync()
+        return self.fallback
+
+    def press(self, key):
+        entry = self._lookup(key)
+        if entry is None:
+            self._fallback().press(key)
+            return
+        self._fake(X.KeyPress, entry[0])
+
+    def release(self, key):
+        entry = self._lookup(key)
+        if entry is None:
+            self._fallback().release(key)
+            return
+        self._fake(X.KeyRelease, entry[0])
+
+    def type(self, text):
+        for char in text:
+            entry = self._lookup(char)
+            if entry is None:
+                self._fallback().type(char)
+                continue
+            keycode, needs_shift = entry
+            if needs_shift:
+                self._fake(X.KeyPress, self.shift_keycode)
+            self._fake(X.KeyPress, keycode)
+            self._fake(X.KeyRelease, keycode)
+            if needs_shift:
+                self._fake(X.KeyRelease, self.shift_keycode)
+
+    def flush(self):
+        if self.pending:
+            self.display.flush()
+            self.pending = 0
+
+    def close(self):
+        self.flush()
+        self.display.close()